@@ -7,9 +7,8 @@ Real-time monitoring dashboard for management and executives.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import random
+from pathlib import Path
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -24,306 +23,305 @@ st.set_page_config(
 # =============================================================================
 # CUSTOM CSS STYLING
 # =============================================================================
-st.markdown("""
-<style>
-    .main .block-container {
-        padding-top: 1rem;
-        padding-bottom: 1rem;
-        max-width: 100%;
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, #1E293B 0%, #334155 100%);
-        border-radius: 16px;
-        padding: 24px;
-        border: 1px solid #475569;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.3);
-    }
-    
-    .metric-card-tv {
-        background: linear-gradient(135deg, #1E293B 0%, #334155 100%);
-        border-radius: 20px;
-        padding: 40px;
-        border: 2px solid #F59E0B;
-        box-shadow: 0 8px 16px -2px rgba(0, 0, 0, 0.4);
-        text-align: center;
-    }
-    
-    .metric-value {
-        font-size: 48px;
-        font-weight: 700;
-        color: #F59E0B;
-        line-height: 1.2;
-    }
-    
-    .metric-value-tv {
-        font-size: 72px;
-        font-weight: 800;
-        color: #F59E0B;
-        line-height: 1.1;
-    }
-    
-    .metric-label {
-        font-size: 14px;
-        color: #E2E8F0 !important;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 8px;
-        font-weight: 500;
-    }
-    
-    .metric-label-tv {
-        font-size: 20px;
-        color: #E2E8F0 !important;
-        text-transform: uppercase;
-        letter-spacing: 2px;
-        margin-bottom: 12px;
-        font-weight: 500;
-    }
-    
-    .metric-delta-positive {
-        color: #10B981;
-        font-size: 14px;
-        font-weight: 500;
-    }
-    
-    .metric-delta-negative {
-        color: #EF4444;
-        font-size: 14px;
-        font-weight: 500;
-    }
-    
-    .section-header {
-        font-size: 18px;
-        font-weight: 600;
-        color: #FFFFFF !important;
-        margin-bottom: 16px;
-        padding-bottom: 8px;
-        border-bottom: 2px solid #F59E0B;
-    }
-    
-    .progress-container {
-        background: #334155;
-        border-radius: 8px;
-        height: 12px;
-        overflow: hidden;
-        margin-top: 8px;
-    }
-    
-    .progress-bar {
-        height: 100%;
-        border-radius: 8px;
-        transition: width 0.5s ease;
-    }
-    
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background-color: #1E293B;
-        border-radius: 8px;
-        padding: 12px 24px;
-        color: #E2E8F0 !important;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background-color: #F59E0B;
-        color: #0F172A !important;
-    }
-    
-    .stMarkdown, .stMarkdown p, .stMarkdown span {
-        color: #FFFFFF !important;
-    }
-    
-    [data-testid="stSidebar"] {
-        color: #FFFFFF !important;
-    }
-    
-    [data-testid="stSidebar"] label {
-        color: #E2E8F0 !important;
-    }
-    
-    h1, h2, h3, h4, h5, h6 {
-        color: #FFFFFF !important;
-    }
-    
-    p, span, div {
-        color: #F1F5F9;
-    }
-    
-    .stSelectbox label, .stDateInput label, .stCheckbox label, .stRadio label {
-        color: #E2E8F0 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    return f'<style>{(Path(__file__).parent / "styles.css").read_text(encoding="utf-8")}</style>'
+
+# Injected on every full run: Streamlit drops elements a run does not emit, so
+# a once-per-session guard would strip the styles. Fragment reruns skip this.
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # =============================================================================
 # DATA GENERATORS
 # =============================================================================
 
-def get_live_metrics():
-    base_calls = 4500 + random.randint(-200, 200)
-    hour = datetime.now().hour
-    multiplier = 1.0 + random.uniform(0.1, 0.3) if 9 <= hour <= 18 else 0.4 + random.uniform(0.1, 0.2)
+REFRESH_INTERVAL = 30
+KPI_REFRESH_INTERVAL = 300
+PERIOD_DAYS = {"Today": 1, "Last 7 Days": 7, "Custom Range": 30}
+
+_LANGUAGE_COLUMNS = ('Language', 'Percentage', 'Calls')
+_INTENT_COLUMNS = ('Intent', 'Count')
+_HOURLY_COLUMNS = ('Hour', 'Calls')
+_DAILY_COLUMNS = ('Date', 'Total Calls', 'AI Resolved', 'Escalated', 'Containment Rate')
+_RESOLUTION_COLUMNS = ('Category', 'Count')
+
+_HOURS = np.arange(24)
+_HOUR_LABELS = tuple(f'{h:02d}:00' for h in _HOURS)
+_HOURLY_BASE = np.where((_HOURS >= 9) & (_HOURS <= 18), 150, 50)
+_LANGUAGES = ('Telugu', 'Hindi', 'English')
+_INTENT_NAMES = ('Bill Inquiry', 'Outage Status', 'Payment Confirmation', 'Complaint Status', 'New Connection')
+_RESOLUTION_CATEGORIES = ('AI Resolved', 'Human Escalation', 'Abandoned', 'Transferred')
+
+# Inclusive (low, high) bounds per row, drawn in one vectorized call.
+_INTENT_LOW, _INTENT_HIGH = np.array([800, 600, 400, 300, 200]), np.array([1200, 900, 600, 500, 400]) + 1
+_RESOLUTION_LOW, _RESOLUTION_HIGH = np.array([3000, 800, 100, 50]), np.array([4000, 1200, 200, 150]) + 1
+_KPI_RATE_KEYS = ('containment_rate', 'fcr_rate', 'avg_handle_time', 'containment_yesterday', 'fcr_yesterday', 'aht_yesterday')
+_KPI_RATE_LOW, _KPI_RATE_HIGH = np.array([68, 65, 4.5, 65, 62, 5.0]), np.array([78, 75, 7.5, 75, 72, 8.0])
+# TV targets for containment, FCR and AHT. AHT is better when lower, so it is
+# negated (against -8 min) to share the same >= comparison.
+_TV_TARGETS = np.array([70, 70, -8])
+
+def refresh_seed(now, interval=REFRESH_INTERVAL):
+    """Seed shared by all generators; rolls over once per refresh window."""
+    return int(now.timestamp() // interval)
+
+def refresh_nonce():
+    """Per-session counter bumped by Refresh Now, so a manual refresh draws new data."""
+    return st.session_state.get("refresh_nonce", 0)
+
+def get_live_metrics(rng, hour):
+    base_offset, active, queue = rng.integers([-200, 80, 5], [201, 181, 36]).tolist()
+    low, high = (1.1, 1.3) if 9 <= hour <= 18 else (0.5, 0.6)
+    multiplier, capacity = rng.uniform([low, 45], [high, 85]).tolist()
     
     return {
-        'active_calls': int(random.randint(80, 180) * multiplier),
-        'calls_today': int(base_calls * multiplier),
-        'calls_queue': random.randint(5, 35),
-        'capacity_utilization': random.uniform(45, 85),
+        'active_calls': int(active * multiplier),
+        'calls_today': int((4500 + base_offset) * multiplier),
+        'calls_queue': queue,
+        'capacity_utilization': capacity,
     }
 
-def get_language_distribution():
-    telugu_pct = random.uniform(52, 62)
-    hindi_pct = random.uniform(22, 30)
-    english_pct = 100 - telugu_pct - hindi_pct
-    return pd.DataFrame({
-        'Language': ['Telugu', 'Hindi', 'English'],
-        'Percentage': [telugu_pct, hindi_pct, english_pct],
-        'Calls': [int(4500 * telugu_pct / 100), int(4500 * hindi_pct / 100), int(4500 * english_pct / 100)]
-    })
-
-def get_top_intents():
-    intents = [
-        ('Bill Inquiry', random.randint(800, 1200)),
-        ('Outage Status', random.randint(600, 900)),
-        ('Payment Confirmation', random.randint(400, 600)),
-        ('Complaint Status', random.randint(300, 500)),
-        ('New Connection', random.randint(200, 400)),
-    ]
-    return pd.DataFrame(intents, columns=['Intent', 'Count'])
-
-def get_performance_kpis():
+def get_language_distribution(rng):
+    telugu_pct, hindi_pct = rng.uniform([52, 22], [62, 30])
+    percentages = np.array([telugu_pct, hindi_pct, 100 - telugu_pct - hindi_pct])
+    language, percentage, calls = _LANGUAGE_COLUMNS
+    return {language: _LANGUAGES, percentage: percentages.tolist(), calls: (4500 * percentages / 100).astype(int).tolist()}
+
+def get_top_intents(rng):
+    counts = rng.integers(_INTENT_LOW, _INTENT_HIGH)
+    intent, count = _INTENT_COLUMNS
+    return {intent: _INTENT_NAMES, count: counts.tolist()}
+
+def get_performance_kpis(rng):
+    kpis = dict(zip(_KPI_RATE_KEYS, rng.uniform(_KPI_RATE_LOW, _KPI_RATE_HIGH).tolist()))
+    kpis['calls_today'], kpis['calls_yesterday'] = rng.integers(4000, 5501, size=2).tolist()
+    return kpis
+
+def get_hourly_call_volume(rng, current_hour):
+    volumes = np.where(_HOURS <= current_hour, _HOURLY_BASE + rng.integers(-30, 51, size=24), 0)
+    hour, calls = _HOURLY_COLUMNS
+    return pd.DataFrame({hour: _HOUR_LABELS, calls: volumes})
+
+@st.cache_data(ttl=KPI_REFRESH_INTERVAL, show_spinner=False)
+def get_daily_trends(seed, today, days=7, nonce=0):
+    rng = np.random.default_rng([seed, nonce])
+    dates = pd.date_range(end=today, periods=days).strftime('%Y-%m-%d').to_numpy()
+    totals = rng.integers(5500, 7501, size=days)
+    contained = (totals * rng.uniform(0.68, 0.78, size=days)).astype(int)
+    return pd.DataFrame(dict(zip(_DAILY_COLUMNS, (dates, totals, contained, totals - contained, contained / totals * 100))))
+
+def get_resolution_breakdown(rng):
+    counts = rng.integers(_RESOLUTION_LOW, _RESOLUTION_HIGH)
+    category, count = _RESOLUTION_COLUMNS
+    return {category: _RESOLUTION_CATEGORIES, count: counts.tolist()}
+
+@st.cache_data(ttl=REFRESH_INTERVAL, show_spinner=False)
+def get_snapshot(seed, hour, nonce=0):
+    """Every per-window dataset, drawn from one Generator and shared by all views."""
+    rng = np.random.default_rng([seed, nonce])
     return {
-        'containment_rate': random.uniform(68, 78),
-        'fcr_rate': random.uniform(65, 75),
-        'avg_handle_time': random.uniform(4.5, 7.5),
-        'calls_today': random.randint(4000, 5500),
-        'calls_yesterday': random.randint(4000, 5500),
-        'containment_yesterday': random.uniform(65, 75),
-        'fcr_yesterday': random.uniform(62, 72),
-        'aht_yesterday': random.uniform(5.0, 8.0)
+        'live': get_live_metrics(rng, hour),
+        'kpis': get_performance_kpis(rng),
+        'languages': get_language_distribution(rng),
+        'intents': get_top_intents(rng),
+        'hourly': get_hourly_call_volume(rng, hour),
+        'resolution': get_resolution_breakdown(rng),
     }
 
-def get_hourly_call_volume():
-    hours = list(range(24))
-    current_hour = datetime.now().hour
-    volumes = []
-    for h in hours:
-        if h <= current_hour:
-            base = 150 if 9 <= h <= 18 else 50
-            volumes.append(base + random.randint(-30, 50))
-        else:
-            volumes.append(0)
-    return pd.DataFrame({'Hour': [f'{h:02d}:00' for h in hours], 'Calls': volumes})
-
-def get_daily_trends(days=7):
-    dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days-1, -1, -1)]
-    data = []
-    for date in dates:
-        total = random.randint(5500, 7500)
-        contained = int(total * random.uniform(0.68, 0.78))
-        data.append({
-            'Date': date, 'Total Calls': total, 'AI Resolved': contained,
-            'Escalated': total - contained, 'Containment Rate': (contained / total) * 100
-        })
-    return pd.DataFrame(data)
-
-def get_resolution_breakdown():
-    return pd.DataFrame({
-        'Category': ['AI Resolved', 'Human Escalation', 'Abandoned', 'Transferred'],
-        'Count': [random.randint(3000, 4000), random.randint(800, 1200), random.randint(100, 200), random.randint(50, 150)]
-    })
-
 # =============================================================================
 # UI COMPONENTS
 # =============================================================================
 
-def render_metric_card(label, value, delta=None, suffix="", is_inverse=False):
+_CARD_TEMPLATE = '<div class="metric-card"><div class="metric-label">{}</div><div class="metric-value">{}</div>{}</div>'
+_CARD_DELTA_TEMPLATE = '<div class="metric-delta-{}">{:+.1f}{} vs yesterday</div>'
+_CARD_TV_TEMPLATE = '<div class="metric-card-tv"><div class="metric-label-tv">{}</div><div class="metric-value-tv" style="color: {};">{}{}</div></div>'
+
+def metric_card_html(label, value, delta=None, suffix="", is_inverse=False):
     delta_html = ""
     if delta is not None:
-        delta_class = "metric-delta-positive" if (delta >= 0 and not is_inverse) or (delta < 0 and is_inverse) else "metric-delta-negative"
-        delta_sign = "+" if delta >= 0 else ""
-        delta_html = f'<div class="{delta_class}">{delta_sign}{delta:.1f}{suffix} vs yesterday</div>'
-    
-    st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-label">{label}</div>
-            <div class="metric-value">{value}</div>
-            {delta_html}
-        </div>
-    """, unsafe_allow_html=True)
-
-def render_metric_card_tv(label, value, suffix="", color="#F59E0B"):
-    st.markdown(f"""
-        <div class="metric-card-tv">
-            <div class="metric-label-tv">{label}</div>
-            <div class="metric-value-tv" style="color: {color};">{value}{suffix}</div>
-        </div>
-    """, unsafe_allow_html=True)
-
-def render_progress_bar(value, max_value=100, color="#F59E0B"):
+        delta_html = _CARD_DELTA_TEMPLATE.format("positive" if (delta >= 0) != is_inverse else "negative", delta, suffix)
+    return _CARD_TEMPLATE.format(label, value, delta_html)
+
+def metric_card_tv_html(label, value, suffix="", color="#F59E0B"):
+    return _CARD_TV_TEMPLATE.format(label, color, value, suffix)
+
+def render_metric_row(cards, tv=False):
+    """Render a row of metric cards (dicts of card kwargs) with a single st.markdown call."""
+    card_html = metric_card_tv_html if tv else metric_card_html
+    cards_html = "".join(card_html(**card) for card in cards)
+    st.markdown(f'<div class="metric-row">{cards_html}</div>', unsafe_allow_html=True)
+
+def progress_bar_html(value, max_value=100, color="#F59E0B", caption=""):
     percentage = min((value / max_value) * 100, 100)
-    st.markdown(f"""
-        <div class="progress-container">
-            <div class="progress-bar" style="width: {percentage}%; background: {color};"></div>
-        </div>
-    """, unsafe_allow_html=True)
-
-def create_gauge_chart(value, title, target=None, max_val=100):
-    color = "#10B981" if value >= (target or 70) else "#F59E0B" if value >= (target or 70) * 0.9 else "#EF4444"
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta", value=value,
-        number={'suffix': '%', 'font': {'size': 36, 'color': '#FFFFFF'}},
-        delta={'reference': target, 'relative': False, 'position': 'bottom'} if target else None,
-        title={'text': title, 'font': {'size': 16, 'color': '#E2E8F0'}},
-        gauge={
-            'axis': {'range': [0, max_val], 'tickcolor': '#475569', 'tickfont': {'color': '#E2E8F0'}},
-            'bar': {'color': color}, 'bgcolor': '#1E293B', 'borderwidth': 2, 'bordercolor': '#475569',
-            'steps': [
-                {'range': [0, target * 0.9] if target else [0, 60], 'color': '#374151'},
-                {'range': [target * 0.9, target] if target else [60, 80], 'color': '#374151'},
-                {'range': [target, max_val] if target else [80, 100], 'color': '#1F2937'}
-            ],
-            'threshold': {'line': {'color': '#F59E0B', 'width': 3}, 'thickness': 0.8, 'value': target} if target else None
-        }
-    ))
-    fig.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font={'color': '#FFFFFF'})
+    caption_html = f"<p style='text-align:center;color:#E2E8F0;'>{caption}</p>" if caption else ""
+    return f'<div>{caption_html}<div class="progress-container"><div class="progress-bar" style="width: {percentage}%; background: {color};"></div></div></div>'
+
+_DELTA_LINE = "<p style='text-align:center;color:{};font-weight:500;'>{} {:.1f}{} vs yesterday</p>"
+
+def render_delta_row(deltas, units, inverse):
+    """Render a row of "vs yesterday" lines with a single st.markdown call.
+
+    A non-negative delta is an improvement; inverse metrics show it with a down arrow.
+    """
+    deltas = np.asarray(deltas, dtype=float)
+    improved = deltas >= 0
+    colors = np.where(improved, '#10B981', '#EF4444')
+    arrows = np.where(improved != np.asarray(inverse), '↑', '↓')
+    lines_html = "".join(_DELTA_LINE.format(*line) for line in zip(colors, arrows, np.abs(deltas), units))
+    st.markdown(f'<div class="metric-row">{lines_html}</div>', unsafe_allow_html=True)
+
+def render_progress_row(bars):
+    """Render a row of captioned progress bars (dicts of bar kwargs) with a single st.markdown call."""
+    bars_html = "".join(progress_bar_html(**bar) for bar in bars)
+    st.markdown(f'<div class="metric-row">{bars_html}</div>', unsafe_allow_html=True)
+
+_GRID_AXIS = {'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}
+_DARK_LAYOUT = dict(
+    height=300, margin=dict(l=20, r=20, t=50, b=20),
+    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font={'color': '#FFFFFF'},
+)
+_DARK_AXES_LAYOUT = dict(_DARK_LAYOUT, xaxis=_GRID_AXIS, yaxis=_GRID_AXIS)
+
+_CATEGORY_COLORS = {'Telugu': '#F59E0B', 'Hindi': '#3B82F6', 'English': '#10B981', 'AI Resolved': '#10B981', 'Human Escalation': '#3B82F6', 'Abandoned': '#EF4444', 'Transferred': '#F59E0B'}
+_AREA_COLORS = ('#10B981', '#3B82F6', '#EF4444', '#F59E0B')
+_AREA_FILLS = tuple(c + '99' for c in _AREA_COLORS)
+
+@st.cache_resource
+def _gauge_row_scaffold(targets, max_val=100):
+    fig = make_subplots(rows=1, cols=len(targets), specs=[[{'type': 'indicator'}] * len(targets)])
+    for i, target in enumerate(targets):
+        fig.add_trace(Indicator(
+            mode="gauge+number+delta",
+            number={'suffix': '%', 'font': {'size': 36, 'color': '#FFFFFF'}},
+            delta={'reference': target, 'relative': False, 'position': 'bottom'} if target else None,
+            title={'font': {'size': 16, 'color': '#E2E8F0'}},
+            gauge={
+                'axis': {'range': [0, max_val], 'tickcolor': '#475569', 'tickfont': {'color': '#E2E8F0'}},
+                'bgcolor': '#1E293B', 'borderwidth': 2, 'bordercolor': '#475569',
+                'steps': [
+                    {'range': [0, target * 0.9] if target else [0, 60], 'color': '#374151'},
+                    {'range': [target * 0.9, target] if target else [60, 80], 'color': '#374151'},
+                    {'range': [target, max_val] if target else [80, 100], 'color': '#1F2937'}
+                ],
+                'threshold': {'line': {'color': '#F59E0B', 'width': 3}, 'thickness': 0.8, 'value': target} if target else None
+            }
+        ), row=1, col=i + 1)
+    fig.update_layout(_DARK_LAYOUT, height=250, margin_t=40)
+    return fig
+
+@st.cache_resource
+def _donut_scaffold():
+    fig = Figure(data=[Pie(hole=0.6, textinfo='label+percent', textposition='outside', textfont={'color': '#FFFFFF', 'size': 12})])
+    fig.update_layout(_DARK_LAYOUT, showlegend=False)
+    return fig
+
+@st.cache_resource
+def _bar_scaffold():
+    fig = Figure(data=[Bar(orientation='h', marker_color='#F59E0B', textposition='outside', textfont={'color': '#FFFFFF'})])
+    fig.update_layout(_DARK_AXES_LAYOUT, yaxis_showgrid=False)
+    return fig
+
+@st.cache_resource
+def _line_scaffold():
+    fig = Figure(data=[Scattergl(mode='lines+markers', line=dict(color='#F59E0B', width=3), marker=dict(size=8, color='#F59E0B'), fill='tozeroy', fillcolor='rgba(245, 158, 11, 0.1)')])
+    fig.update_layout(_DARK_AXES_LAYOUT, title=dict(font=dict(size=16, color='#FFFFFF'), x=0.5))
     return fig
 
-def create_donut_chart(df, names_col, values_col):
-    colors = {'Telugu': '#F59E0B', 'Hindi': '#3B82F6', 'English': '#10B981', 'AI Resolved': '#10B981', 'Human Escalation': '#3B82F6', 'Abandoned': '#EF4444', 'Transferred': '#F59E0B'}
-    color_list = [colors.get(name, '#94A3B8') for name in df[names_col]]
-    fig = go.Figure(data=[go.Pie(labels=df[names_col], values=df[values_col], hole=0.6, marker_colors=color_list, textinfo='label+percent', textposition='outside', textfont={'color': '#FFFFFF', 'size': 12})])
-    fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', showlegend=False, font={'color': '#FFFFFF'})
+@st.cache_resource
+def _area_scaffold(y_cols):
+    fig = Figure()
+    for i, col in enumerate(y_cols):
+        # Scattergl has no stackgroup, so traces are stacked by hand and filled to the previous one.
+        fig.add_trace(Scattergl(mode='lines', name=col, fill='tozeroy' if i == 0 else 'tonexty', line=dict(color=_AREA_COLORS[i % len(_AREA_COLORS)]), fillcolor=_AREA_FILLS[i % len(_AREA_FILLS)], hovertemplate='%{x}<br>%{customdata:,}'))
+    fig.update_layout(_DARK_AXES_LAYOUT, legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5, font={'color': '#FFFFFF'}))
     return fig
 
-def create_bar_chart(df, x_col, y_col):
-    fig = go.Figure(data=[go.Bar(x=df[y_col], y=df[x_col], orientation='h', marker_color='#F59E0B', text=df[y_col], textposition='outside', textfont={'color': '#FFFFFF'})])
-    fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis={'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}, yaxis={'showgrid': False, 'tickfont': {'color': '#E2E8F0'}}, font={'color': '#FFFFFF'})
+@st.cache_resource
+def _trend_scaffold(target=70):
+    fig = Figure(data=[Scattergl(mode='lines+markers', line=dict(color='#F59E0B', width=3), marker=dict(size=10))])
+    fig.add_hline(y=target, line_dash="dash", line_color="#10B981", annotation_text=f"Target: {target}%", annotation_position="right", annotation=dict(font_color="#10B981"))
+    fig.update_layout(_DARK_AXES_LAYOUT, margin_t=20, yaxis_range=[50, 100])
+    return fig
+
+MAX_PLOT_POINTS = 1000
+
+def lttb_indices(y, n_out=MAX_PLOT_POINTS):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling."""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    y = np.asarray(y, dtype=float)
+    x = np.arange(n, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+# Scaffolds are shared across sessions, so each chart works on its own copy
+# and only swaps in the values that change between refreshes. The builders
+# themselves are not cached: st.cache_data would pickle the figure and
+# re-validate it on every hit, which costs as much as the copy.
+
+def create_gauge_row(values, titles, targets, max_val=100):
+    """One figure holding a gauge per value, so the row boots a single Plotly.js instance."""
+    fig = Figure(_gauge_row_scaffold(tuple(targets), max_val))
+    values, thresholds = np.asarray(values), np.array([target or 70 for target in targets])
+    colors = np.select([values >= thresholds, values >= thresholds * 0.9], ["#10B981", "#F59E0B"], "#EF4444").tolist()
+    for i, (value, title, color) in enumerate(zip(values.tolist(), titles, colors)):
+        fig.update_traces(value=value, title_text=title, gauge_bar_color=color, selector=i)
+    return fig
+
+def create_donut_chart(labels, values):
+    color_list = [_CATEGORY_COLORS.get(name, '#94A3B8') for name in labels]
+    fig = Figure(_donut_scaffold())
+    fig.update_traces(labels=labels, values=values, marker_colors=color_list)
+    return fig
+
+def create_bar_chart(labels, values):
+    fig = Figure(_bar_scaffold())
+    fig.update_traces(x=values, y=labels, text=values)
     return fig
 
 def create_line_chart(df, x_col, y_col, title=""):
-    fig = go.Figure(data=[go.Scatter(x=df[x_col], y=df[y_col], mode='lines+markers', line=dict(color='#F59E0B', width=3), marker=dict(size=8, color='#F59E0B'), fill='tozeroy', fillcolor='rgba(245, 158, 11, 0.1)')])
-    fig.update_layout(title=dict(text=title, font=dict(size=16, color='#FFFFFF'), x=0.5), height=300, margin=dict(l=20, r=20, t=50, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis={'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}, yaxis={'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}, font={'color': '#FFFFFF'})
+    x, y = df[x_col].to_numpy(), df[y_col].to_numpy()
+    keep = lttb_indices(y)
+    fig = Figure(_line_scaffold())
+    fig.update_traces(x=x[keep], y=y[keep])
+    if title:
+        fig.update_layout(title_text=title)
     return fig
 
 def create_area_chart(df, x_col, y_cols):
-    colors = ['#10B981', '#3B82F6']
-    fig = go.Figure()
+    x, values = df[x_col].to_numpy(), df[list(y_cols)].to_numpy()
+    stacked = values.cumsum(axis=1)
+    keep = lttb_indices(stacked[:, -1])
+    x, values, stacked = x[keep], values[keep], stacked[keep]
+    fig = Figure(_area_scaffold(tuple(y_cols)))
     for i, col in enumerate(y_cols):
-        fig.add_trace(go.Scatter(x=df[x_col], y=df[col], mode='lines', name=col, stackgroup='one', line=dict(color=colors[i]), fillcolor=colors[i] + '99'))
-    fig.update_layout(height=300, margin=dict(l=20, r=20, t=50, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis={'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}, yaxis={'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}, legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5, font={'color': '#FFFFFF'}), font={'color': '#FFFFFF'})
+        fig.update_traces(x=x, y=stacked[:, i], customdata=values[:, i], selector=dict(name=col))
+    return fig
+
+def create_trend_chart(df, x_col, y_col, target=70):
+    x, y = df[x_col].to_numpy(), df[y_col].to_numpy()
+    keep = lttb_indices(y)
+    fig = Figure(_trend_scaffold(target))
+    fig.update_traces(x=x[keep], y=y[keep], name=y_col)
     return fig
 
 # =============================================================================
 # SIDEBAR
 # =============================================================================
 
+now = datetime.now()
+
 with st.sidebar:
     st.image("https://upload.wikimedia.org/wikipedia/en/thumb/8/8f/Telangana_State_Electricity_Regulatory_Commission_logo.png/220px-Telangana_State_Electricity_Regulatory_Commission_logo.png", width=80)
     st.title("TGSPDCL")
@@ -338,23 +336,24 @@ with st.sidebar:
     if date_option == "Custom Range":
         scol1, scol2 = st.columns(2)
         with scol1:
-            start_date = st.date_input("From", datetime.now() - timedelta(days=7))
+            start_date = st.date_input("From", now - timedelta(days=7))
         with scol2:
-            end_date = st.date_input("To", datetime.now())
+            end_date = st.date_input("To", now)
     st.divider()
     
-    auto_refresh = st.toggle("🔄 Auto Refresh (30s)", value=True)
+    auto_refresh = st.toggle("🔄 Auto Refresh", value=True)
     if auto_refresh:
-        st.caption("Dashboard refreshes automatically")
+        st.caption(f"Live data every {REFRESH_INTERVAL}s, KPIs every {KPI_REFRESH_INTERVAL // 60} min")
     if st.button("🔄 Refresh Now", use_container_width=True):
-        st.rerun()
-    st.divider()
-    st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
+        st.session_state["refresh_nonce"] = refresh_nonce() + 1
 
 # =============================================================================
 # MAIN CONTENT
 # =============================================================================
 
+run_every = REFRESH_INTERVAL if auto_refresh else None
+kpi_run_every = KPI_REFRESH_INTERVAL if auto_refresh else None
+
 st.markdown("""
     <h1 style='color: #FFFFFF; margin-bottom: 0;'>⚡ TGSPDCL Voice Agent Dashboard</h1>
     <p style='color: #E2E8F0; font-size: 16px;'>Executive Monitoring Dashboard | Real-time AI Performance Tracking</p>
@@ -364,172 +363,174 @@ st.markdown("""
 # TV DISPLAY MODE
 # =============================================================================
 
-if display_mode == "TV Display":
-    st.markdown("---")
-    live_metrics = get_live_metrics()
-    kpis = get_performance_kpis()
-    
-    tvcol1, tvcol2, tvcol3 = st.columns(3)
-    with tvcol1:
-        render_metric_card_tv("Active Calls", live_metrics['active_calls'], color="#3B82F6")
-    with tvcol2:
-        render_metric_card_tv("Calls Today", f"{live_metrics['calls_today']:,}", color="#F59E0B")
-    with tvcol3:
-        render_metric_card_tv("Queue", live_metrics['calls_queue'], color="#EF4444" if live_metrics['calls_queue'] > 20 else "#10B981")
+@st.fragment(run_every=run_every)
+def tv_display_fragment():
+    now = datetime.now()
+    st.caption(f"Last updated: {now.strftime('%H:%M:%S')}")
+    seed = refresh_seed(now)
+    snapshot = get_snapshot(seed, now.hour, refresh_nonce())
+    live_metrics, kpis = snapshot['live'], snapshot['kpis']
+    on_target = np.array([kpis['containment_rate'], kpis['fcr_rate'], -kpis['avg_handle_time']]) >= _TV_TARGETS
+    containment_color, fcr_color, aht_color = np.where(on_target, "#10B981", "#F59E0B").tolist()
+    
+    render_metric_row([
+        dict(label="Active Calls", value=live_metrics['active_calls'], color="#3B82F6"),
+        dict(label="Calls Today", value=f"{live_metrics['calls_today']:,}", color="#F59E0B"),
+        dict(label="Queue", value=live_metrics['calls_queue'], color="#EF4444" if live_metrics['calls_queue'] > 20 else "#10B981"),
+    ], tv=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
-    tvcol4, tvcol5, tvcol6 = st.columns(3)
-    with tvcol4:
-        color = "#10B981" if kpis['containment_rate'] >= 70 else "#F59E0B"
-        render_metric_card_tv("Containment Rate", f"{kpis['containment_rate']:.1f}", suffix="%", color=color)
-    with tvcol5:
-        color = "#10B981" if kpis['fcr_rate'] >= 70 else "#F59E0B"
-        render_metric_card_tv("First Call Resolution", f"{kpis['fcr_rate']:.1f}", suffix="%", color=color)
-    with tvcol6:
-        color = "#10B981" if kpis['avg_handle_time'] <= 8 else "#F59E0B"
-        render_metric_card_tv("Avg Handle Time", f"{kpis['avg_handle_time']:.1f}", suffix=" min", color=color)
+    render_metric_row([
+        dict(label="Containment Rate", value=f"{kpis['containment_rate']:.1f}", suffix="%", color=containment_color),
+        dict(label="First Call Resolution", value=f"{kpis['fcr_rate']:.1f}", suffix="%", color=fcr_color),
+        dict(label="Avg Handle Time", value=f"{kpis['avg_handle_time']:.1f}", suffix=" min", color=aht_color),
+    ], tv=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
-    tvcol7, tvcol8, tvcol9 = st.columns(3)
-    with tvcol7:
-        st.markdown("<p style='text-align:center;color:#E2E8F0;'>Target: 70%</p>", unsafe_allow_html=True)
-        render_progress_bar(kpis['containment_rate'], 100, "#10B981" if kpis['containment_rate'] >= 70 else "#F59E0B")
-    with tvcol8:
-        st.markdown("<p style='text-align:center;color:#E2E8F0;'>Target: 70%</p>", unsafe_allow_html=True)
-        render_progress_bar(kpis['fcr_rate'], 100, "#10B981" if kpis['fcr_rate'] >= 70 else "#F59E0B")
-    with tvcol9:
-        st.markdown("<p style='text-align:center;color:#E2E8F0;'>Target: ≤8 min</p>", unsafe_allow_html=True)
-        render_progress_bar(8 - kpis['avg_handle_time'] + 8, 16, "#10B981" if kpis['avg_handle_time'] <= 8 else "#F59E0B")
+    render_progress_row([
+        dict(value=kpis['containment_rate'], max_value=100, color=containment_color, caption="Target: 70%"),
+        dict(value=kpis['fcr_rate'], max_value=100, color=fcr_color, caption="Target: 70%"),
+        dict(value=8 - kpis['avg_handle_time'] + 8, max_value=16, color=aht_color, caption="Target: ≤8 min"),
+    ])
 
 # =============================================================================
 # DESKTOP MODE
 # =============================================================================
 
-else:
-    tab1, tab2 = st.tabs(["📊 Live Operations", "📈 Performance KPIs"])
-    
-    with tab1:
-        live_metrics = get_live_metrics()
-        language_dist = get_language_distribution()
-        top_intents = get_top_intents()
-        
-        st.markdown('<div class="section-header">📡 Current Status</div>', unsafe_allow_html=True)
-        
-        lcol1, lcol2, lcol3 = st.columns(3)
-        with lcol1:
-            render_metric_card("Active Calls", live_metrics['active_calls'], delta=random.randint(-15, 25))
-        with lcol2:
-            render_metric_card("Calls Today", f"{live_metrics['calls_today']:,}", delta=random.randint(-5, 8), suffix="%")
-        with lcol3:
-            render_metric_card("Queue Size", live_metrics['calls_queue'], delta=random.randint(-8, 12), is_inverse=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        left_col, right_col = st.columns(2)
-        with left_col:
-            st.markdown('<div class="section-header">🌐 Language Distribution</div>', unsafe_allow_html=True)
-            fig = create_donut_chart(language_dist, 'Language', 'Percentage')
-            st.plotly_chart(fig, use_container_width=True)
-            for _, row in language_dist.iterrows():
-                lcola, lcolb = st.columns([3, 1])
-                with lcola:
-                    st.markdown(f"**{row['Language']}**")
-                with lcolb:
-                    st.markdown(f"{row['Percentage']:.1f}%")
-        
-        with right_col:
-            st.markdown('<div class="section-header">🎯 Top Customer Intents</div>', unsafe_allow_html=True)
-            fig = create_bar_chart(top_intents, 'Intent', 'Count')
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown('<div class="section-header">📈 Hourly Call Volume (Today)</div>', unsafe_allow_html=True)
-        hourly_data = get_hourly_call_volume()
-        fig = create_line_chart(hourly_data, 'Hour', 'Calls')
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab2:
-        kpis = get_performance_kpis()
-        daily_trends = get_daily_trends(7 if date_option == "Last 7 Days" else 30 if date_option == "Custom Range" else 1)
-        resolution_data = get_resolution_breakdown()
-        
-        st.markdown('<div class="section-header">🎯 Key Performance Indicators</div>', unsafe_allow_html=True)
-        
-        kcol1, kcol2, kcol3 = st.columns(3)
-        with kcol1:
-            fig = create_gauge_chart(kpis['containment_rate'], "Containment Rate", target=70)
-            st.plotly_chart(fig, use_container_width=True)
-            delta = kpis['containment_rate'] - kpis['containment_yesterday']
-            st.markdown(f"<p style='text-align:center;color:{'#10B981' if delta >= 0 else '#EF4444'};font-weight:500;'>{'↑' if delta >= 0 else '↓'} {abs(delta):.1f}% vs yesterday</p>", unsafe_allow_html=True)
-        
-        with kcol2:
-            fig = create_gauge_chart(kpis['fcr_rate'], "First Call Resolution", target=70)
-            st.plotly_chart(fig, use_container_width=True)
-            delta = kpis['fcr_rate'] - kpis['fcr_yesterday']
-            st.markdown(f"<p style='text-align:center;color:{'#10B981' if delta >= 0 else '#EF4444'};font-weight:500;'>{'↑' if delta >= 0 else '↓'} {abs(delta):.1f}% vs yesterday</p>", unsafe_allow_html=True)
-        
-        with kcol3:
-            aht_score = max(0, 100 - (kpis['avg_handle_time'] / 12) * 100)
-            fig = create_gauge_chart(aht_score, f"Avg Handle Time: {kpis['avg_handle_time']:.1f} min", target=66.7)
-            st.plotly_chart(fig, use_container_width=True)
-            delta = kpis['aht_yesterday'] - kpis['avg_handle_time']
-            st.markdown(f"<p style='text-align:center;color:{'#10B981' if delta >= 0 else '#EF4444'};font-weight:500;'>{'↓' if delta >= 0 else '↑'} {abs(delta):.1f} min vs yesterday</p>", unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.markdown('<div class="section-header">📊 Today vs Yesterday</div>', unsafe_allow_html=True)
-        
-        ccol1, ccol2, ccol3 = st.columns(3)
-        with ccol1:
-            change = ((kpis['calls_today'] - kpis['calls_yesterday']) / kpis['calls_yesterday']) * 100
-            render_metric_card("Total Calls", f"{kpis['calls_today']:,}", delta=change, suffix="%")
-        
-        with ccol2:
-            ai_resolved = int(kpis['calls_today'] * kpis['containment_rate'] / 100)
-            ai_yesterday = int(kpis['calls_yesterday'] * kpis['containment_yesterday'] / 100)
-            change = ((ai_resolved - ai_yesterday) / ai_yesterday) * 100 if ai_yesterday > 0 else 0
-            render_metric_card("AI Resolved", f"{ai_resolved:,}", delta=change, suffix="%")
-        
-        with ccol3:
-            escalated = kpis['calls_today'] - ai_resolved
-            esc_yesterday = kpis['calls_yesterday'] - ai_yesterday
-            change = ((escalated - esc_yesterday) / esc_yesterday) * 100 if esc_yesterday > 0 else 0
-            render_metric_card("Escalated", f"{escalated:,}", delta=change, suffix="%", is_inverse=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        chcol1, chcol2 = st.columns(2)
-        with chcol1:
-            st.markdown('<div class="section-header">📈 Call Volume Trend</div>', unsafe_allow_html=True)
-            if len(daily_trends) > 1:
-                fig = create_line_chart(daily_trends, 'Date', 'Total Calls')
-            else:
-                fig = create_line_chart(get_hourly_call_volume(), 'Hour', 'Calls', "Today's Hourly Volume")
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with chcol2:
-            st.markdown('<div class="section-header">🥧 Resolution Breakdown</div>', unsafe_allow_html=True)
-            if len(daily_trends) > 1:
-                fig = create_area_chart(daily_trends, 'Date', ['AI Resolved', 'Escalated'])
-            else:
-                fig = create_donut_chart(resolution_data, 'Category', 'Count')
-            st.plotly_chart(fig, use_container_width=True)
-        
+# Each tab body is its own fragment, so a refresh of one tab never re-runs the
+# other. Live operations follow the 30s cadence; KPIs are aggregates and
+# refresh every 5 minutes.
+
+@st.fragment(run_every=run_every)
+def live_ops_fragment():
+    now = datetime.now()
+    st.caption(f"Last updated: {now.strftime('%H:%M:%S')}")
+    seed = refresh_seed(now)
+    snapshot = get_snapshot(seed, now.hour, refresh_nonce())
+    live_metrics, language_dist, top_intents = snapshot['live'], snapshot['languages'], snapshot['intents']
+
+    # Status deltas are per-viewer noise, so they come from the session's own
+    # Generator rather than the shared, seeded snapshot.
+    session_rng = st.session_state.setdefault("rng", np.random.default_rng())
+    active_delta, calls_delta, queue_delta = session_rng.integers([-15, -5, -8], [26, 9, 13]).tolist()
+
+    st.markdown('<div class="section-header">📡 Current Status</div>', unsafe_allow_html=True)
+
+    render_metric_row([
+        dict(label="Active Calls", value=live_metrics['active_calls'], delta=active_delta),
+        dict(label="Calls Today", value=f"{live_metrics['calls_today']:,}", delta=calls_delta, suffix="%"),
+        dict(label="Queue Size", value=live_metrics['calls_queue'], delta=queue_delta, is_inverse=True),
+    ])
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    left_col, right_col = st.columns(2)
+    with left_col:
+        st.markdown('<div class="section-header">🌐 Language Distribution</div>', unsafe_allow_html=True)
+        fig = create_donut_chart(language_dist['Language'], language_dist['Percentage'])
+        st.plotly_chart(fig, use_container_width=True, key="donut_language")
+        rows_html = "".join(f'<div class="lang-row"><b>{lang}</b><span>{pct:.1f}%</span></div>' for lang, pct in zip(language_dist['Language'], language_dist['Percentage']))
+        st.markdown(rows_html, unsafe_allow_html=True)
+
+    with right_col:
+        st.markdown('<div class="section-header">🎯 Top Customer Intents</div>', unsafe_allow_html=True)
+        fig = create_bar_chart(top_intents['Intent'], top_intents['Count'])
+        st.plotly_chart(fig, use_container_width=True, key="bar_intents")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown('<div class="section-header">📈 Hourly Call Volume (Today)</div>', unsafe_allow_html=True)
+    hourly_data = snapshot['hourly']
+    fig = create_line_chart(hourly_data, 'Hour', 'Calls')
+    st.plotly_chart(fig, use_container_width=True, key="line_hourly")
+
+@st.fragment(run_every=kpi_run_every)
+def kpi_fragment(date_option):
+    now = datetime.now()
+    st.caption(f"Last updated: {now.strftime('%H:%M:%S')}")
+    seed = refresh_seed(now)
+    snapshot = get_snapshot(seed, now.hour, refresh_nonce())
+    kpis = snapshot['kpis']
+    days = PERIOD_DAYS[date_option]
+    # Daily totals move slowly, so they roll over on the KPI cadence rather
+    # than every live refresh.
+    trends_seed = refresh_seed(now, KPI_REFRESH_INTERVAL)
+    trends_key, trends_version = f"trends_{days}", (trends_seed, refresh_nonce())
+    if st.session_state.get(trends_key, (None,))[0] != trends_version:
+        st.session_state[trends_key] = (trends_version, get_daily_trends(trends_seed, now.date(), days, refresh_nonce()))
+    daily_trends = st.session_state[trends_key][1]
+    resolution_data = snapshot['resolution']
+
+    st.markdown('<div class="section-header">🎯 Key Performance Indicators</div>', unsafe_allow_html=True)
+
+    aht_score = max(0, 100 - (kpis['avg_handle_time'] / 12) * 100)
+    fig = create_gauge_row(
+        [kpis['containment_rate'], kpis['fcr_rate'], aht_score],
+        ["Containment Rate", "First Call Resolution", f"Avg Handle Time: {kpis['avg_handle_time']:.1f} min"],
+        targets=(70, 70, 66.7),
+    )
+    st.plotly_chart(fig, use_container_width=True, key="gauges_kpi")
+    render_delta_row(
+        [kpis['containment_rate'] - kpis['containment_yesterday'], kpis['fcr_rate'] - kpis['fcr_yesterday'], kpis['aht_yesterday'] - kpis['avg_handle_time']],
+        units=("%", "%", " min"), inverse=(False, False, True),
+    )
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown('<div class="section-header">📊 Today vs Yesterday</div>', unsafe_allow_html=True)
+
+    calls_change = ((kpis['calls_today'] - kpis['calls_yesterday']) / kpis['calls_yesterday']) * 100
+    ai_resolved = int(kpis['calls_today'] * kpis['containment_rate'] / 100)
+    ai_yesterday = int(kpis['calls_yesterday'] * kpis['containment_yesterday'] / 100)
+    ai_change = ((ai_resolved - ai_yesterday) / ai_yesterday) * 100 if ai_yesterday > 0 else 0
+    escalated = kpis['calls_today'] - ai_resolved
+    esc_yesterday = kpis['calls_yesterday'] - ai_yesterday
+    esc_change = ((escalated - esc_yesterday) / esc_yesterday) * 100 if esc_yesterday > 0 else 0
+
+    render_metric_row([
+        dict(label="Total Calls", value=f"{kpis['calls_today']:,}", delta=calls_change, suffix="%"),
+        dict(label="AI Resolved", value=f"{ai_resolved:,}", delta=ai_change, suffix="%"),
+        dict(label="Escalated", value=f"{escalated:,}", delta=esc_change, suffix="%", is_inverse=True),
+    ])
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    chcol1, chcol2 = st.columns(2)
+    with chcol1:
+        st.markdown('<div class="section-header">📈 Call Volume Trend</div>', unsafe_allow_html=True)
         if len(daily_trends) > 1:
-            st.markdown("<br>", unsafe_allow_html=True)
-            st.markdown('<div class="section-header">📊 Containment Rate Trend</div>', unsafe_allow_html=True)
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=daily_trends['Date'], y=daily_trends['Containment Rate'], mode='lines+markers', name='Containment Rate', line=dict(color='#F59E0B', width=3), marker=dict(size=10)))
-            fig.add_hline(y=70, line_dash="dash", line_color="#10B981", annotation_text="Target: 70%", annotation_position="right", annotation=dict(font_color="#10B981"))
-            fig.update_layout(height=300, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', xaxis={'showgrid': True, 'gridcolor': '#334155', 'tickfont': {'color': '#E2E8F0'}}, yaxis={'showgrid': True, 'gridcolor': '#334155', 'range': [50, 100], 'tickfont': {'color': '#E2E8F0'}}, font={'color': '#FFFFFF'})
-            st.plotly_chart(fig, use_container_width=True)
+            fig = create_line_chart(daily_trends, 'Date', 'Total Calls')
+        else:
+            fig = create_line_chart(snapshot['hourly'], 'Hour', 'Calls', "Today's Hourly Volume")
+        st.plotly_chart(fig, use_container_width=True, key="line_call_volume")
+
+    with chcol2:
+        st.markdown('<div class="section-header">🥧 Resolution Breakdown</div>', unsafe_allow_html=True)
+        if len(daily_trends) > 1:
+            fig = create_area_chart(daily_trends, 'Date', ['AI Resolved', 'Escalated'])
+        else:
+            fig = create_donut_chart(resolution_data['Category'], resolution_data['Count'])
+        st.plotly_chart(fig, use_container_width=True, key="chart_resolution")
+
+    if len(daily_trends) > 1:
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown('<div class="section-header">📊 Containment Rate Trend</div>', unsafe_allow_html=True)
+        fig = create_trend_chart(daily_trends, 'Date', 'Containment Rate', target=70)
+        st.plotly_chart(fig, use_container_width=True, key="line_containment_trend")
 
 # =============================================================================
-# AUTO-REFRESH
+# LAYOUT
 # =============================================================================
 
-if auto_refresh:
-    import time
-    time.sleep(30)
-    st.rerun()
+if display_mode == "TV Display":
+    st.markdown("---")
+    tv_display_fragment()
+else:
+    # Only Desktop mode draws charts, so TV mode never pays for loading Plotly.
+    from plotly.graph_objects import Bar, Figure, Indicator, Pie, Scattergl
+    from plotly.subplots import make_subplots
+    tab1, tab2 = st.tabs(["📊 Live Operations", "📈 Performance KPIs"])
+    with tab1:
+        live_ops_fragment()
+    with tab2:
+        kpi_fragment(date_option)